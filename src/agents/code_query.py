@@ -11,6 +11,7 @@ from langgraph.prebuilt import ToolNode
 
 from src.tools.oracle_mcp import (
     search_code_snippets,
+    search_code_snippets_batch,
     get_snippet_by_id,
     list_available_categories,
     list_available_languages
@@ -50,6 +51,7 @@ Your role:
 
 Available tools:
 - search_code_snippets: Search by language, category, framework, or keyword
+- search_code_snippets_batch: Run several searches at once (pass a list of filter dicts); prefer this over repeated search_code_snippets calls
 - get_snippet_by_id: Get a specific snippet by ID
 - list_available_categories: See what categories exist
 - list_available_languages: See what languages are available
@@ -79,6 +81,7 @@ def create_code_query_agent():
 
     tools = [
         search_code_snippets,
+        search_code_snippets_batch,
         get_snippet_by_id,
         list_available_categories,
         list_available_languages
@@ -197,6 +200,33 @@ def query_code_snippets(query: str) -> str:
         return result.get("results", "No results found.")
 
 
+async def aquery_code_snippets(query: str) -> str:
+    """
+    Async variant of query_code_snippets, for running agents concurrently.
+
+    Args:
+        query: Natural language query about code
+
+    Returns:
+        Formatted response with relevant code snippets
+    """
+    with tracer.start_as_current_span("code_query_agent_invoke") as span:
+        span.set_attribute("query", query)
+
+        # Use cached agent instead of creating new one each time
+        agent = get_code_query_agent()
+
+        result = await agent.ainvoke({
+            "messages": [HumanMessage(content=query)],
+            "query": query,
+            "results": ""
+        })
+
+        span.set_attribute("result_length", len(result.get("results", "")))
+
+        return result.get("results", "No results found.")
+
+
 # For testing
 if __name__ == "__main__":
     from dotenv import load_dotenv
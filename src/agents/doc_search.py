@@ -202,6 +202,33 @@ def search_docs(query: str) -> str:
         return result.get("results", "No results found.")
 
 
+async def asearch_docs(query: str) -> str:
+    """
+    Async variant of search_docs, for running agents concurrently.
+
+    Args:
+        query: Natural language query about documentation
+
+    Returns:
+        Formatted response with relevant documentation
+    """
+    with tracer.start_as_current_span("doc_search_agent_invoke") as span:
+        span.set_attribute("query", query)
+
+        # Use cached agent instead of creating new one each time
+        agent = get_doc_search_agent()
+
+        result = await agent.ainvoke({
+            "messages": [HumanMessage(content=query)],
+            "query": query,
+            "results": ""
+        })
+
+        span.set_attribute("result_length", len(result.get("results", "")))
+
+        return result.get("results", "No results found.")
+
+
 # For testing
 if __name__ == "__main__":
     from dotenv import load_dotenv
@@ -2,48 +2,153 @@
 Orchestrator Agent - Coordinates between Doc Search and Code Query agents.
 Routes queries and combines results for comprehensive answers.
 """
-from typing import TypedDict, Annotated, Sequence, Literal
+from typing import TypedDict, Annotated, Sequence, Literal, Optional
+import asyncio
 import operator
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, END
 
-from src.agents.doc_search import search_docs
-from src.agents.code_query import query_code_snippets
+from src.agents.doc_search import search_docs, asearch_docs
+from src.agents.code_query import query_code_snippets, aquery_code_snippets
 from src.config import settings
 
-# Import OpenTelemetry context for thread propagation
-try:
-    from opentelemetry import context as otel_context
-    OTEL_AVAILABLE = True
-except ImportError:
-    OTEL_AVAILABLE = False
-
 # Import tracer with graceful fallback
 try:
-    from src.telemetry import get_tracer
+    from src.telemetry import get_tracer, capture_span_durations
     tracer = get_tracer(__name__)
 except ImportError:
     from contextlib import contextmanager
-    class NoOpTracer:
-        @contextmanager
-        def start_as_current_span(self, name, **kwargs):
-            class NoOpSpan:
-                def set_attribute(self, k, v): pass
-            yield NoOpSpan()
+    # The OTel API ships a no-op tracer; no need to hand-roll one
+    from opentelemetry.trace import NoOpTracer
     tracer = NoOpTracer()
 
+    @contextmanager
+    def capture_span_durations():
+        yield {}
+
+# Optional semantic cache tier (near-duplicate queries via embeddings)
+try:
+    from sentence_transformers import SentenceTransformer
+    import numpy as np
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
+
+# Bridge to the shared background event loop. The sub-agents' LLMs hold
+# long-lived async HTTP clients, which must always run on the same loop
+try:
+    from src.tools.sqlcl_mcp_client import run_async
+except ImportError:
+    run_async = None
+
+
+# Response cache - repeated queries skip the full agent pipeline
+_RESPONSE_CACHE_SIZE = 512
+_SEMANTIC_THRESHOLD = 0.95
+
+_response_cache: "OrderedDict[str, dict]" = OrderedDict()
+_embedder = None
+_semantic_keys: list[str] = []
+_semantic_vectors = None  # numpy matrix of normalized query embeddings
+
+# Guards all cache state above - Streamlit serves each session from its own
+# thread, so unguarded mutation could desync keys from vectors
+_cache_lock = threading.Lock()
+
+
+def _normalize_query(query: str) -> str:
+    """Normalize a query for cache lookup: lowercase, collapse whitespace, strip trailing punctuation."""
+    return " ".join(query.split()).lower().rstrip(".!?")
+
+
+def _get_embedder():
+    """Get cached sentence-transformers embedder (loaded once on first use)."""
+    global _embedder
+    if _embedder is None:
+        _embedder = SentenceTransformer("all-MiniLM-L6-v2")
+    return _embedder
+
+
+def _semantic_lookup(cache_key: str) -> Optional[dict]:
+    """Find a cached response for a semantically near-identical query."""
+    if not SEMANTIC_CACHE_AVAILABLE or _semantic_vectors is None:
+        return None
+    try:
+        # Embed outside the lock - model inference is the slow part
+        vector = _get_embedder().encode([cache_key], normalize_embeddings=True)[0]
+        with _cache_lock:
+            if _semantic_vectors is None:
+                return None
+            scores = _semantic_vectors @ vector
+            best = int(np.argmax(scores))
+            if scores[best] >= _SEMANTIC_THRESHOLD:
+                return _response_cache.get(_semantic_keys[best])
+    except Exception:
+        # Semantic tier is best-effort; fall back to a cache miss
+        pass
+    return None
+
+
+def _cache_get(cache_key: str) -> Optional[dict]:
+    """Look up a cached response: exact match first, then semantic match."""
+    with _cache_lock:
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            _response_cache.move_to_end(cache_key)
+            return cached
+    return _semantic_lookup(cache_key)
+
+
+def _semantic_remove(cache_key: str):
+    """Drop a key's embedding from the semantic index, if present (lock held by caller)."""
+    global _semantic_vectors
+    try:
+        index = _semantic_keys.index(cache_key)
+    except ValueError:
+        return
+    _semantic_keys.pop(index)
+    _semantic_vectors = np.delete(_semantic_vectors, index, axis=0) if _semantic_keys else None
+
+
+def _cache_put(cache_key: str, result: dict):
+    """Store a response in the cache, evicting the oldest entry when full."""
+    global _semantic_vectors
+    vector = None
+    if SEMANTIC_CACHE_AVAILABLE:
+        try:
+            # Embed outside the lock - model inference is the slow part
+            vector = _get_embedder().encode([cache_key], normalize_embeddings=True)
+        except Exception:
+            pass
+    with _cache_lock:
+        _response_cache[cache_key] = result
+        if len(_response_cache) > _RESPONSE_CACHE_SIZE:
+            # Evict the semantic entry in lockstep so the index stays bounded
+            # and never points at keys the LRU has dropped
+            evicted_key, _ = _response_cache.popitem(last=False)
+            if SEMANTIC_CACHE_AVAILABLE:
+                _semantic_remove(evicted_key)
+        if vector is not None and cache_key not in _semantic_keys:
+            _semantic_vectors = vector if _semantic_vectors is None else np.vstack([_semantic_vectors, vector])
+            _semantic_keys.append(cache_key)
+
 
 # Orchestrator State
-class OrchestratorState(TypedDict):
-    """State for the Orchestrator Agent."""
+class OrchestratorState(TypedDict, total=False):
+    """State for the Orchestrator Agent. Keys are optional; nodes fill them in as they run."""
     messages: Annotated[Sequence[BaseMessage], operator.add]
     query: str
     doc_results: str
     code_results: str
     final_response: str
     agents_to_call: list[str]
+    degraded: bool
 
 
 # System prompt for orchestrator
@@ -71,180 +176,212 @@ Be helpful and concise. Developers want answers, not fluff.
 """
 
 
-def create_orchestrator_agent():
-    """Create and return the Orchestrator Agent graph."""
+# System prompt for synthesis - static so Anthropic can cache the prefix across calls
+SYNTHESIS_SYSTEM_PROMPT = """You are a helpful coding assistant synthesizing information for developers.
 
-    # Initialize LLM
-    llm = ChatAnthropic(
+Given the user's question and the gathered information, synthesize a clear, helpful response that:
+1. Explains the concept briefly (if docs available)
+2. Shows relevant code examples (if code available)
+3. Provides practical tips
+4. Is well-formatted with headers and code blocks
+
+Keep it concise but complete."""
+
+
+# Scaffold for the per-query synthesis message, built once at import
+_SYNTHESIS_TEMPLATE = """**User Question:** {query}
+
+**Documentation/Explanation:**
+{docs}
+
+**Code Examples:**
+{code}"""
+
+
+# Routing keywords - compiled once into word-boundary patterns so matching
+# runs in C and "whatever" no longer matches "what"
+DOCS_KEYWORDS = (
+    "how", "what", "why", "explain", "concept", "best practice",
+    "documentation", "tutorial", "guide", "learn"
+)
+
+CODE_KEYWORDS = (
+    "code", "example", "snippet", "implement", "show me",
+    "sample", "function", "class", "script",
+    # Database-related keywords - always query code snippets for these
+    "database", "oracle", "connect", "sql", "query", "table",
+    "insert", "select", "python", "java", "fastapi", "langchain"
+)
+
+_DOCS_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, DOCS_KEYWORDS)) + r")\b", re.IGNORECASE)
+_CODE_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, CODE_KEYWORDS)) + r")\b", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1)
+def _get_llm() -> ChatAnthropic:
+    """Get the shared orchestrator LLM (constructed and validated once)."""
+    return ChatAnthropic(
         model=settings.llm_model,
         api_key=settings.anthropic_api_key,
         temperature=0
     )
 
-    def analyze_query(state: OrchestratorState) -> OrchestratorState:
-        """Analyze query and decide which agents to call."""
-        with tracer.start_as_current_span("orchestrator_analyze") as span:
-            query = state["query"].lower()
-            span.set_attribute("query", query)
-
-            agents_to_call = []
-
-            # Heuristics for routing
-            needs_docs = any(word in query for word in [
-                "how", "what", "why", "explain", "concept", "best practice",
-                "documentation", "tutorial", "guide", "learn"
-            ])
-
-            needs_code = any(word in query for word in [
-                "code", "example", "snippet", "implement", "show me",
-                "sample", "function", "class", "script",
-                # Database-related keywords - always query code snippets for these
-                "database", "oracle", "connect", "sql", "query", "table",
-                "insert", "select", "python", "java", "fastapi", "langchain"
-            ])
-
-            # Default: if unclear, call both
-            if not needs_docs and not needs_code:
-                needs_docs = True
-                needs_code = True
-
-            if needs_docs:
-                agents_to_call.append("doc_search")
-            if needs_code:
-                agents_to_call.append("code_query")
-
-            span.set_attribute("agents_to_call", str(agents_to_call))
-
-            return {"agents_to_call": agents_to_call}
-
-    def call_agents_parallel(state: OrchestratorState) -> OrchestratorState:
-        """Call Doc Search and Code Query agents in parallel for faster response."""
-        with tracer.start_as_current_span("orchestrator_call_agents_parallel") as span:
-            query = state["query"]
-            agents_to_call = state.get("agents_to_call", [])
-            span.set_attribute("query", query)
-            span.set_attribute("agents", str(agents_to_call))
-
-            doc_results = ""
-            code_results = ""
 
-            # Capture current context for thread propagation
-            current_context = otel_context.get_current() if OTEL_AVAILABLE else None
-
-            def run_with_context(func, *args):
-                """Run function with propagated OpenTelemetry context."""
-                if OTEL_AVAILABLE and current_context:
-                    token = otel_context.attach(current_context)
-                    try:
-                        return func(*args)
-                    finally:
-                        otel_context.detach(token)
-                return func(*args)
-
-            # Run agents in parallel using ThreadPoolExecutor
-            with ThreadPoolExecutor(max_workers=2) as executor:
-                futures = {}
-
-                if "doc_search" in agents_to_call:
-                    futures[executor.submit(run_with_context, search_docs, query)] = "doc_search"
-                if "code_query" in agents_to_call:
-                    futures[executor.submit(run_with_context, query_code_snippets, query)] = "code_query"
-
-                for future in as_completed(futures):
-                    agent_name = futures[future]
-                    try:
-                        result = future.result()
-                        if agent_name == "doc_search":
-                            doc_results = result
-                        else:
-                            code_results = result
-                    except Exception as e:
-                        span.set_attribute(f"{agent_name}.error", str(e))
+def analyze_query(state: OrchestratorState) -> OrchestratorState:
+    """Analyze query and decide which agents to call."""
+    with tracer.start_as_current_span("orchestrator_analyze") as span:
+        query = state["query"]
+        span.set_attribute("query", query)
 
-            span.set_attribute("doc_results_length", len(doc_results))
-            span.set_attribute("code_results_length", len(code_results))
+        # Heuristics for routing (precompiled case-insensitive patterns)
+        needs_docs = bool(_DOCS_RE.search(query))
+        needs_code = bool(_CODE_RE.search(query))
 
-            return {"doc_results": doc_results, "code_results": code_results}
+        # Build the agent list directly - if unclear, default to both
+        if needs_docs == needs_code:
+            agents_to_call = ["doc_search", "code_query"]
+        elif needs_docs:
+            agents_to_call = ["doc_search"]
+        else:
+            agents_to_call = ["code_query"]
 
-    def call_doc_search(state: OrchestratorState) -> OrchestratorState:
-        """Call the Doc Search Agent (fallback for single agent)."""
-        with tracer.start_as_current_span("orchestrator_call_doc_search") as span:
-            query = state["query"]
-            span.set_attribute("query", query)
+        span.set_attribute("agents_to_call", str(agents_to_call))
 
-            result = search_docs(query)
+        return {"agents_to_call": agents_to_call}
 
-            span.set_attribute("result_length", len(result))
 
-            return {"doc_results": result}
+async def _gather_agent_results(query: str) -> list:
+    """Run both agents concurrently on the event loop."""
+    return await asyncio.gather(
+        asearch_docs(query),
+        aquery_code_snippets(query),
+        return_exceptions=True
+    )
 
-    def call_code_query(state: OrchestratorState) -> OrchestratorState:
-        """Call the Code Query Agent (fallback for single agent)."""
-        with tracer.start_as_current_span("orchestrator_call_code_query") as span:
-            query = state["query"]
-            span.set_attribute("query", query)
 
-            result = query_code_snippets(query)
+def call_agents_parallel(state: OrchestratorState) -> OrchestratorState:
+    """Call Doc Search and Code Query agents in parallel for faster response."""
+    with tracer.start_as_current_span("orchestrator_call_agents_parallel") as span:
+        query = state["query"]
+        # The router only dispatches here when both agents are needed
+        assert len(state["agents_to_call"]) == 2, "parallel node requires both agents"
+        span.set_attribute("query", query)
 
-            span.set_attribute("result_length", len(result))
+        # Run agents concurrently on the shared background loop. A per-query
+        # asyncio.run loop would strand the agents' async HTTP clients (and
+        # their keep-alive connections) on closed loops, and concurrent
+        # invocations would drive one httpx client from several live loops
+        if run_async is not None:
+            doc_results, code_results = run_async(_gather_agent_results(query))
+        else:
+            doc_results, code_results = asyncio.run(_gather_agent_results(query))
+
+        # Swallowed agent failures mark the answer as degraded so it is
+        # served once but never cached
+        degraded = False
+        if isinstance(doc_results, Exception):
+            span.set_attribute("doc_search.error", str(doc_results))
+            doc_results = ""
+            degraded = True
+        if isinstance(code_results, Exception):
+            span.set_attribute("code_query.error", str(code_results))
+            code_results = ""
+            degraded = True
 
-            return {"code_results": result}
+        span.set_attribute("doc_results_length", len(doc_results))
+        span.set_attribute("code_results_length", len(code_results))
 
-    def combine_results(state: OrchestratorState) -> OrchestratorState:
-        """Combine results from both agents into final response."""
-        with tracer.start_as_current_span("orchestrator_combine") as span:
-            doc_results = state.get("doc_results", "")
-            code_results = state.get("code_results", "")
-            query = state["query"]
+        return {"doc_results": doc_results, "code_results": code_results, "degraded": degraded}
 
-            # Build prompt for final synthesis
-            synthesis_prompt = f"""Based on the user's question and the gathered information, provide a comprehensive answer.
 
-**User Question:** {query}
+def call_doc_search(state: OrchestratorState) -> OrchestratorState:
+    """Call the Doc Search Agent (fallback for single agent)."""
+    with tracer.start_as_current_span("orchestrator_call_doc_search") as span:
+        query = state["query"]
+        span.set_attribute("query", query)
 
-**Documentation/Explanation:**
-{doc_results if doc_results else "No documentation found."}
+        result = search_docs(query)
 
-**Code Examples:**
-{code_results if code_results else "No code examples found."}
+        span.set_attribute("result_length", len(result))
 
-**Your Task:**
-Synthesize this information into a clear, helpful response that:
-1. Explains the concept briefly (if docs available)
-2. Shows relevant code examples (if code available)
-3. Provides practical tips
-4. Is well-formatted with headers and code blocks
+        return {"doc_results": result}
 
-Keep it concise but complete."""
 
-            messages = [
-                SystemMessage(content="You are a helpful coding assistant synthesizing information for developers."),
-                HumanMessage(content=synthesis_prompt)
-            ]
+def call_code_query(state: OrchestratorState) -> OrchestratorState:
+    """Call the Code Query Agent (fallback for single agent)."""
+    with tracer.start_as_current_span("orchestrator_call_code_query") as span:
+        query = state["query"]
+        span.set_attribute("query", query)
 
-            response = llm.invoke(messages)
+        result = query_code_snippets(query)
+
+        span.set_attribute("result_length", len(result))
+
+        return {"code_results": result}
+
+
+def combine_results(state: OrchestratorState, config: Optional[RunnableConfig] = None) -> OrchestratorState:
+    """Combine results from both agents into final response."""
+    with tracer.start_as_current_span("orchestrator_combine") as span:
+        doc_results = state.get("doc_results", "")
+        code_results = state.get("code_results", "")
+        query = state["query"]
+
+        # Only the per-query content goes in the human message; the static
+        # instructions live in the system message marked for prompt caching
+        synthesis_prompt = _SYNTHESIS_TEMPLATE.format(
+            query=query,
+            docs=doc_results or "No documentation found.",
+            code=code_results or "No code examples found."
+        )
+
+        messages = [
+            SystemMessage(content=[{
+                "type": "text",
+                "text": SYNTHESIS_SYSTEM_PROMPT,
+                "cache_control": {"type": "ephemeral"}
+            }]),
+            HumanMessage(content=synthesis_prompt)
+        ]
+
+        status_callback = ((config or {}).get("configurable") or {}).get("status_callback")
+
+        if status_callback is not None:
+            # Stream tokens so the UI can render the answer as it generates
+            # instead of waiting for the full completion
+            chunks = []
+            for chunk in _get_llm().stream(messages):
+                if isinstance(chunk.content, str) and chunk.content:
+                    chunks.append(chunk.content)
+                    status_callback("Orchestrator", "token", chunk.content)
+            response_text = "".join(chunks)
+        else:
+            response_text = _get_llm().invoke(messages).content
+
+        span.set_attribute("response_length", len(response_text))
 
-            span.set_attribute("response_length", len(response.content))
+        return {
+            "final_response": response_text,
+            "messages": [AIMessage(content=response_text)]
+        }
 
-            return {
-                "final_response": response.content,
-                "messages": [AIMessage(content=response.content)]
-            }
 
-    def route_to_agents(state: OrchestratorState) -> str:
-        """Route to the appropriate agents - use parallel when both are needed."""
-        agents = state.get("agents_to_call", [])
+# Conditional-edge lookup keyed on the selected agent set; analyze_query
+# always produces one of these three combinations
+_ROUTES = {
+    frozenset({"doc_search", "code_query"}): "parallel",
+    frozenset({"doc_search"}): "doc_search",
+    frozenset({"code_query"}): "code_query"
+}
 
-        if not agents:
-            return "combine"
 
-        # If both agents are needed, use parallel execution for speed
-        if len(agents) == 2:
-            return "parallel"
+def route_to_agents(state: OrchestratorState) -> str:
+    """Route to the appropriate agents - use parallel when both are needed."""
+    return _ROUTES[frozenset(state["agents_to_call"])]
 
-        # Single agent
-        return agents[0]
 
+def create_orchestrator_agent():
+    """Create and return the Orchestrator Agent graph."""
     # Build the graph
     workflow = StateGraph(OrchestratorState)
 
@@ -265,8 +402,7 @@ Keep it concise but complete."""
         {
             "parallel": "parallel",
             "doc_search": "doc_search",
-            "code_query": "code_query",
-            "combine": "combine"
+            "code_query": "code_query"
         }
     )
 
@@ -293,6 +429,16 @@ def get_orchestrator_agent():
     return _cached_orchestrator
 
 
+# Map OTel span names (opened by the nodes and agent entry points) to the
+# timing keys reported to callers
+_TIMING_SPANS = {
+    "orchestrator_analyze": "orchestrator_analyze",
+    "doc_search_agent_invoke": "doc_search",
+    "code_query_agent_invoke": "code_query",
+    "orchestrator_combine": "combine"
+}
+
+
 def ask_assistant(query: str, status_callback=None) -> dict:
     """
     Main entry point for the Code Assistant.
@@ -310,13 +456,29 @@ def ask_assistant(query: str, status_callback=None) -> dict:
         "doc_search": 0,
         "code_query": 0,
         "combine": 0,
-        "total": 0
+        "total": 0,
+        "cache_hit": False
     }
     start_time = time.time()
 
     with tracer.start_as_current_span("code_assistant_query") as span:
         span.set_attribute("query", query)
 
+        # Check response cache before running the agent pipeline
+        cache_key = _normalize_query(query)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            timing = dict(cached["timing"])
+            timing["cache_hit"] = True
+            timing["total"] = time.time() - start_time
+            span.set_attribute("cache.hit", True)
+            if status_callback:
+                status_callback("Orchestrator", "complete", "Answer served from cache")
+            return {
+                "response": cached["response"],
+                "timing": timing
+            }
+
         if status_callback:
             status_callback("Orchestrator", "analyzing", "Analyzing query...")
 
@@ -324,63 +486,56 @@ def ask_assistant(query: str, status_callback=None) -> dict:
         orchestrator = get_orchestrator_agent()
 
         # Initial state
+        # Only seed the keys the graph needs - remaining state keys are
+        # populated by the nodes that produce them
         initial_state = {
             "messages": [HumanMessage(content=query)],
-            "query": query,
-            "doc_results": "",
-            "code_results": "",
-            "final_response": "",
-            "agents_to_call": []
+            "query": query
         }
 
-        # Use streaming for real-time updates
-        node_start_time = time.time()
-        final_state = None
-
-        for event in orchestrator.stream(initial_state):
-            # event is a dict with node name as key
-            for node_name, node_output in event.items():
-                node_end_time = time.time()
-                node_duration = node_end_time - node_start_time
-
-                # Track timing
-                if node_name == "analyze":
-                    timing["orchestrator_analyze"] = node_duration
-                    if status_callback:
-                        agents = node_output.get("agents_to_call", [])
-                        status_callback("Orchestrator", "routing", f"Will query: {', '.join(agents) if agents else 'combining results'}")
-                elif node_name == "parallel":
-                    # Parallel execution - time is split between agents
-                    timing["doc_search"] = node_duration / 2
-                    timing["code_query"] = node_duration / 2
-                    if status_callback:
-                        status_callback("Doc Search Agent", "running", "Searching documentation...")
-                        status_callback("Code Query Agent", "running", "Querying code snippets...")
-                        status_callback("Doc Search Agent", "complete", "Documentation retrieved")
-                        status_callback("Code Query Agent", "complete", "Code snippets retrieved")
-                elif node_name == "doc_search":
-                    timing["doc_search"] = node_duration
-                    if status_callback:
-                        status_callback("Doc Search Agent", "running", "Searching documentation...")
-                        status_callback("Doc Search Agent", "complete", "Documentation retrieved")
-                elif node_name == "code_query":
-                    timing["code_query"] = node_duration
-                    if status_callback:
-                        status_callback("Code Query Agent", "running", "Querying code snippets...")
-                        status_callback("Code Query Agent", "complete", "Code snippets retrieved")
-                elif node_name == "combine":
-                    timing["combine"] = node_duration
-                    if status_callback:
-                        status_callback("Orchestrator", "combining", "Synthesizing response...")
-
-                # Update final state
-                if final_state is None:
-                    final_state = node_output
-                else:
-                    final_state.update(node_output)
-
-                node_start_time = time.time()
+        with capture_span_durations() as span_durations:
+            if status_callback is None:
+                # No UI to update - invoke directly and skip the streaming iteration
+                final_state = orchestrator.invoke(initial_state)
+            else:
+                # Use streaming for real-time updates
+                final_state = None
+
+                # Expose the callback to nodes (combine_results streams tokens
+                # through it) via the per-invocation config
+                config = {"configurable": {"status_callback": status_callback}}
+
+                for event in orchestrator.stream(initial_state, config):
+                    # event is a dict with node name as key
+                    for node_name, node_output in event.items():
+                        if node_name == "analyze":
+                            agents = node_output.get("agents_to_call", [])
+                            status_callback("Orchestrator", "routing", f"Will query: {', '.join(agents) if agents else 'combining results'}")
+                        elif node_name == "parallel":
+                            status_callback("Doc Search Agent", "running", "Searching documentation...")
+                            status_callback("Code Query Agent", "running", "Querying code snippets...")
+                            status_callback("Doc Search Agent", "complete", "Documentation retrieved")
+                            status_callback("Code Query Agent", "complete", "Code snippets retrieved")
+                        elif node_name == "doc_search":
+                            status_callback("Doc Search Agent", "running", "Searching documentation...")
+                            status_callback("Doc Search Agent", "complete", "Documentation retrieved")
+                        elif node_name == "code_query":
+                            status_callback("Code Query Agent", "running", "Querying code snippets...")
+                            status_callback("Code Query Agent", "complete", "Code snippets retrieved")
+                        elif node_name == "combine":
+                            status_callback("Orchestrator", "combining", "Synthesizing response...")
+
+                        # Update final state
+                        if final_state is None:
+                            final_state = node_output
+                        else:
+                            final_state.update(node_output)
 
+        # Per-node timing comes from the OTel spans the nodes already open;
+        # the zeros stay in place when telemetry is not initialized
+        for span_name, timing_key in _TIMING_SPANS.items():
+            if span_name in span_durations:
+                timing[timing_key] = span_durations[span_name]
         timing["total"] = time.time() - start_time
 
         response = final_state.get("final_response", "Sorry, I couldn't find an answer.") if final_state else "Sorry, I couldn't find an answer."
@@ -391,12 +546,116 @@ def ask_assistant(query: str, status_callback=None) -> dict:
         span.set_attribute("response_length", len(response))
         span.set_attribute("total_time_ms", timing["total"] * 1000)
 
+        # Populate the cache so repeated queries skip the pipeline - but only
+        # with genuine answers: a missing final_response or an agent failure
+        # is transient, and caching it would pin the bad answer (and, via the
+        # semantic tier, its near-duplicates) for the process lifetime
+        if final_state and final_state.get("final_response") and not final_state.get("degraded"):
+            _cache_put(cache_key, {"response": response, "timing": dict(timing)})
+
         return {
             "response": response,
             "timing": timing
         }
 
 
+async def aask_assistant(query: str) -> dict:
+    """
+    Async entry point for the Code Assistant.
+
+    Runs the orchestrator graph via ainvoke so independent queries can be
+    processed concurrently with asyncio.gather.
+
+    Args:
+        query: User's question about coding
+
+    Returns:
+        Dictionary with 'response' and 'timing' data
+    """
+    import time
+    timing = {
+        "orchestrator_analyze": 0,
+        "doc_search": 0,
+        "code_query": 0,
+        "combine": 0,
+        "total": 0,
+        "cache_hit": False
+    }
+    start_time = time.time()
+
+    with tracer.start_as_current_span("code_assistant_query") as span:
+        span.set_attribute("query", query)
+
+        # Check response cache before running the agent pipeline
+        cache_key = _normalize_query(query)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            timing = dict(cached["timing"])
+            timing["cache_hit"] = True
+            timing["total"] = time.time() - start_time
+            span.set_attribute("cache.hit", True)
+            return {
+                "response": cached["response"],
+                "timing": timing
+            }
+
+        orchestrator = get_orchestrator_agent()
+
+        # Only seed the keys the graph needs - remaining state keys are
+        # populated by the nodes that produce them
+        initial_state = {
+            "messages": [HumanMessage(content=query)],
+            "query": query
+        }
+
+        with capture_span_durations() as span_durations:
+            final_state = await orchestrator.ainvoke(initial_state)
+
+        for span_name, timing_key in _TIMING_SPANS.items():
+            if span_name in span_durations:
+                timing[timing_key] = span_durations[span_name]
+        timing["total"] = time.time() - start_time
+
+        response = final_state.get("final_response", "Sorry, I couldn't find an answer.")
+
+        span.set_attribute("response_length", len(response))
+        span.set_attribute("total_time_ms", timing["total"] * 1000)
+
+        # Cache only genuine answers (see ask_assistant)
+        if final_state.get("final_response") and not final_state.get("degraded"):
+            _cache_put(cache_key, {"response": response, "timing": dict(timing)})
+
+        return {
+            "response": response,
+            "timing": timing
+        }
+
+
+async def ask_assistant_batch(queries: list[str], max_concurrency: int = 8) -> list[dict]:
+    """
+    Answer a batch of independent queries concurrently.
+
+    Queries run through aask_assistant under a bounded semaphore so large
+    batches don't flood the Anthropic/Tavily/Oracle backends. Results come
+    back in input order, and duplicate or near-duplicate queries within a
+    batch still benefit from the shared response cache.
+
+    Args:
+        queries: List of user questions
+        max_concurrency: Maximum number of queries in flight at once
+
+    Returns:
+        List of {'response', 'timing'} dicts, one per query
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _bounded(query: str) -> dict:
+        async with semaphore:
+            return await aask_assistant(query)
+
+    return await asyncio.gather(*[_bounded(query) for query in queries])
+
+
 # For testing
 if __name__ == "__main__":
     from dotenv import load_dotenv
@@ -416,13 +675,13 @@ if __name__ == "__main__":
         "What is connection pooling and how do I implement it with Oracle?",
     ]
 
-    def print_status(agent, status, details):
-        print(f"  [{agent}] {status}: {details}")
+    # Run all test queries concurrently - wall clock is ~max(per-query latency)
+    # instead of the sum
+    results = asyncio.run(ask_assistant_batch(test_queries))
 
-    for query in test_queries:
+    for query, result in zip(test_queries, results):
         print(f"\n{'='*70}")
         print(f"Query: {query}")
         print('='*70)
-        result = ask_assistant(query, status_callback=print_status)
         print(f"\nResponse:\n{result['response']}")
         print(f"\nTiming: {result['timing']}")
@@ -3,7 +3,6 @@ Configuration management for Code Assistant.
 Loads settings from environment variables.
 """
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from functools import lru_cache
 from typing import Optional
 
 
@@ -49,11 +48,11 @@ class Settings(BaseSettings):
         return f"{self.oracle_host}:{self.oracle_port}/{self.oracle_service}"
 
 
-@lru_cache()
-def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
+# Global settings instance - constructed exactly once at import; the .env
+# parse happens here and nowhere else
+settings = Settings()
 
 
-# Global settings instance
-settings = get_settings()
+def get_settings() -> Settings:
+    """Get the shared settings instance."""
+    return settings
@@ -39,8 +39,15 @@ from src.telemetry.tracing import init_telemetry
 # Apply custom styles
 apply_custom_styles()
 
+
+@st.cache_resource
+def _init_telemetry_once():
+    """Initialize telemetry once per server process, not on every script rerun."""
+    return init_telemetry("code-assistant")
+
+
 # Initialize telemetry for Jaeger traces
-init_telemetry("code-assistant")
+_init_telemetry_once()
 
 
 def process_query(query: str):
@@ -59,9 +66,18 @@ def process_query(query: str):
         "start_time": time.time()
     }
 
+    # Placeholder that fills incrementally while the final answer streams
+    streaming_placeholder = st.empty()
+    streaming_tokens = []
+
     # Status callback for real-time updates
     def status_callback(agent: str, status: str, details: str):
         """Update agent activity in real-time."""
+        if status == "token":
+            # Token-by-token synthesis output - render incrementally
+            streaming_tokens.append(details)
+            streaming_placeholder.markdown("".join(streaming_tokens))
+            return
         st.session_state.agent_activity.append({
             "agent": agent,
             "status": status,
@@ -77,6 +93,9 @@ def process_query(query: str):
         response = result["response"]
         timing = result["timing"]
 
+        # The streamed preview is replaced by the chat message on rerender
+        streaming_placeholder.empty()
+
         # Add assistant message
         st.session_state.messages.append({
             "role": "assistant",
@@ -109,42 +128,43 @@ def process_query(query: str):
         })
 
 
+# Approximate display splits for agent sub-spans (the exact spans live in
+# Jaeger; these only shape the in-app timeline)
+_AGENT_SUBSPAN_SPLITS = {
+    "doc_search_agent": (("llm_invoke", 0.6), ("tavily_search", 0.4)),
+    "code_query_agent": (("llm_invoke", 0.7), ("oracle_mcp_query", 0.3))
+}
+
+
+def _agent_span(name: str, duration: float) -> dict:
+    """Build a level-1 agent span with its approximate sub-spans."""
+    return {
+        "name": name,
+        "duration": duration,
+        "level": 1,
+        "children": [
+            {"name": child, "duration": duration * fraction, "level": 2}
+            for child, fraction in _AGENT_SUBSPAN_SPLITS[name]
+        ]
+    }
+
+
 def build_trace_data(timing: dict) -> dict:
     """Build trace visualization data from real timing measurements."""
     total_time = timing.get("total", 1)
-    analyze_time = timing.get("orchestrator_analyze", 0)
     doc_search_time = timing.get("doc_search", 0)
     code_query_time = timing.get("code_query", 0)
-    combine_time = timing.get("combine", 0)
 
-    # Build children list, filtering out None values
     children = [
-        {"name": "orchestrator_analyze", "duration": analyze_time, "level": 1}
+        {"name": "orchestrator_analyze", "duration": timing.get("orchestrator_analyze", 0), "level": 1}
     ]
 
     if doc_search_time > 0:
-        children.append({
-            "name": "doc_search_agent",
-            "duration": doc_search_time,
-            "level": 1,
-            "children": [
-                {"name": "llm_invoke", "duration": doc_search_time * 0.6, "level": 2},
-                {"name": "tavily_search", "duration": doc_search_time * 0.4, "level": 2}
-            ]
-        })
-
+        children.append(_agent_span("doc_search_agent", doc_search_time))
     if code_query_time > 0:
-        children.append({
-            "name": "code_query_agent",
-            "duration": code_query_time,
-            "level": 1,
-            "children": [
-                {"name": "llm_invoke", "duration": code_query_time * 0.7, "level": 2},
-                {"name": "oracle_mcp_query", "duration": code_query_time * 0.3, "level": 2}
-            ]
-        })
+        children.append(_agent_span("code_query_agent", code_query_time))
 
-    children.append({"name": "orchestrator_combine", "duration": combine_time, "level": 1})
+    children.append({"name": "orchestrator_combine", "duration": timing.get("combine", 0), "level": 1})
 
     return {
         "spans": [
@@ -3,6 +3,7 @@ from src.telemetry.tracing import (
     init_telemetry,
     get_tracer,
     traced,
+    capture_span_durations,
     shutdown_telemetry
 )
 
@@ -10,5 +11,6 @@ __all__ = [
     "init_telemetry",
     "get_tracer",
     "traced",
+    "capture_span_durations",
     "shutdown_telemetry"
 ]
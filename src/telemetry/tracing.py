@@ -4,6 +4,7 @@ Works even before full telemetry initialization.
 """
 import logging
 import os
+from contextvars import ContextVar
 from functools import wraps
 from typing import Callable, Any, Optional
 from contextlib import contextmanager
@@ -15,6 +16,46 @@ logger = logging.getLogger(__name__)
 _telemetry_initialized = False
 _tracer_provider = None
 
+# Active duration-capture dict for the current request (None = not capturing)
+_span_durations: ContextVar[Optional[dict]] = ContextVar("span_durations", default=None)
+
+
+class _SpanDurationProcessor:
+    """
+    In-process span processor that records span durations (in seconds,
+    keyed by span name) into the active capture_span_durations() scope.
+    """
+
+    def on_start(self, span, parent_context=None):
+        pass
+
+    def on_end(self, span):
+        durations = _span_durations.get()
+        if durations is not None and span.start_time and span.end_time:
+            durations[span.name] = (span.end_time - span.start_time) / 1e9
+
+    def shutdown(self):
+        pass
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return True
+
+
+@contextmanager
+def capture_span_durations():
+    """
+    Capture durations of spans that end within this scope.
+
+    Yields a dict mapping span name -> duration in seconds, filled in as
+    spans complete. Empty when the OTel SDK is not initialized.
+    """
+    durations = {}
+    token = _span_durations.set(durations)
+    try:
+        yield durations
+    finally:
+        _span_durations.reset(token)
+
 
 def init_telemetry(service_name: str = None) -> Any:
     """Initialize OpenTelemetry. Safe to call multiple times."""
@@ -23,11 +64,14 @@ def init_telemetry(service_name: str = None) -> Any:
     if _telemetry_initialized:
         return _tracer_provider
 
+    # Mark initialized up front so a failed attempt is not retried on every
+    # subsequent call (e.g. app.py import plus orchestrator __main__)
+    _telemetry_initialized = True
+
     try:
         from opentelemetry import trace
         from opentelemetry.sdk.trace import TracerProvider
         from opentelemetry.sdk.trace.export import BatchSpanProcessor
-        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
         from opentelemetry.sdk.resources import Resource, SERVICE_NAME
 
         from src.config import settings
@@ -37,15 +81,23 @@ def init_telemetry(service_name: str = None) -> Any:
         resource = Resource.create({SERVICE_NAME: service_name})
         provider = TracerProvider(resource=resource)
 
-        otlp_exporter = OTLPSpanExporter(
-            endpoint=settings.otel_exporter_endpoint,
-            insecure=True
-        )
-        provider.add_span_processor(BatchSpanProcessor(otlp_exporter))
+        # Always record span durations in-process; the OTLP exporter is
+        # optional and only added when its dependencies are available
+        provider.add_span_processor(_SpanDurationProcessor())
+
+        try:
+            from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+            otlp_exporter = OTLPSpanExporter(
+                endpoint=settings.otel_exporter_endpoint,
+                insecure=True
+            )
+            provider.add_span_processor(BatchSpanProcessor(otlp_exporter))
+        except Exception as e:
+            logger.debug(f"OTLP exporter not configured: {e}")
+
         trace.set_tracer_provider(provider)
 
         _tracer_provider = provider
-        _telemetry_initialized = True
 
         logger.debug(f"Telemetry initialized: {service_name}")
         return provider
@@ -1,6 +1,7 @@
 """Tools module exports."""
 from src.tools.oracle_mcp import (
     search_code_snippets,
+    search_code_snippets_batch,
     get_snippet_by_id,
     list_available_categories,
     list_available_languages
@@ -15,6 +16,7 @@ from src.tools.tavily_search import (
 __all__ = [
     # Oracle tools
     "search_code_snippets",
+    "search_code_snippets_batch",
     "get_snippet_by_id",
     "list_available_categories",
     "list_available_languages",
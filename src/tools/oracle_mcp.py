@@ -12,32 +12,38 @@ The SQLcl MCP mode provides:
 - Activity logging in DBTOOLS$MCP_LOG table
 - Session tracking via V$SESSION
 """
+import asyncio
 import json
 import logging
 import os
+import re
+import time
 from typing import Optional, List, Dict, Any
 from langchain_core.tools import tool
+from cachetools import TTLCache, cached
 import oracledb
-from functools import lru_cache
+import threading
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Fetch CLOB/BLOB columns directly as str/bytes instead of LOB locators,
+# which would cost one extra round-trip per LOB cell to read
+oracledb.defaults.fetch_lobs = False
+
 # Import tracer with graceful fallback
 try:
     from src.telemetry import get_tracer
     tracer = get_tracer(__name__)
 except ImportError:
-    # Fallback no-op tracer
+    # Fallback no-op tracer: a shared sentinel span wrapped in nullcontext,
+    # so disabled telemetry costs no generator/instance allocation per query
+    from contextlib import nullcontext
+    _NOOP_SPAN = type("NoOpSpan", (), {"set_attribute": lambda *args: None})()
+
     class NoOpTracer:
         def start_as_current_span(self, name, **kwargs):
-            from contextlib import contextmanager
-            @contextmanager
-            def noop():
-                class NoOpSpan:
-                    def set_attribute(self, k, v): pass
-                yield NoOpSpan()
-            return noop()
+            return nullcontext(_NOOP_SPAN)
     tracer = NoOpTracer()
 
 # Import MCP client
@@ -48,6 +54,17 @@ except ImportError:
     get_mcp_client = None
     run_async = None
 
+# Prefer orjson for tool responses (C-level encoding with fast string
+# escaping); fall back to stdlib json if not installed
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2, default=str)
+
 
 def _get_connection_params() -> dict:
     """Get Oracle connection parameters from environment."""
@@ -58,24 +75,79 @@ def _get_connection_params() -> dict:
     }
 
 
-@lru_cache(maxsize=1)
+# Pool singleton with double-checked locking: the hot path is a plain
+# `is not _POOL_UNSET` check, cheaper than an lru_cache call for a
+# zero-arg getter. A failed creation is cached as None, as before.
+_POOL_UNSET = object()
+_pool = _POOL_UNSET
+_pool_lock = threading.Lock()
+
+
 def _get_connection_pool():
     """Get or create a connection pool (cached)."""
+    global _pool
+    pool = _pool
+    if pool is not _POOL_UNSET:
+        return pool
+    with _pool_lock:
+        if _pool is _POOL_UNSET:
+            _pool = _create_connection_pool()
+        return _pool
+
+
+def _create_connection_pool():
+    """Create the sync connection pool (None if creation fails)."""
     params = _get_connection_params()
     try:
         return oracledb.create_pool(
             user=params["user"],
             password=params["password"],
             dsn=params["dsn"],
-            min=1,
-            max=5,
-            increment=1
+            min=5,
+            max=int(os.getenv("ORACLE_POOL_MAX", "20")),
+            increment=5,
+            # TIMEDWAIT honors wait_timeout: acquisition queues up to 3s on
+            # an exhausted pool, then fails instead of blocking forever
+            getmode=oracledb.POOL_GETMODE_TIMEDWAIT,
+            wait_timeout=3000,
+            stmtcachesize=40
         )
     except Exception as e:
         logger.debug(f"Could not create connection pool: {e}")
         return None
 
 
+# Async pools are bound to the event loop they were created on (normally
+# just the shared background loop), so they are cached per loop rather
+# than as a single module global
+_async_pools: dict = {}
+
+
+def _get_async_connection_pool():
+    """Get or create the async connection pool for the running event loop."""
+    loop = asyncio.get_running_loop()
+    # Drop pools whose loops have closed; they can no longer serve queries
+    # (or run their close coroutine), so release them to garbage collection
+    for dead_loop in [cached for cached in _async_pools if cached.is_closed()]:
+        _async_pools.pop(dead_loop, None)
+    if loop not in _async_pools:
+        params = _get_connection_params()
+        try:
+            _async_pools[loop] = oracledb.create_pool_async(
+                user=params["user"],
+                password=params["password"],
+                dsn=params["dsn"],
+                min=2,
+                max=15,
+                increment=2,
+                stmtcachesize=40
+            )
+        except Exception as e:
+            logger.debug(f"Could not create async connection pool: {e}")
+            _async_pools[loop] = None
+    return _async_pools[loop]
+
+
 class OracleDirectTool:
     """Tool for executing SQL queries via direct oracledb connection."""
 
@@ -83,6 +155,29 @@ class OracleDirectTool:
         """
         Execute a SQL query using oracledb.
 
+        Runs aexecute_query on the shared background event loop when the
+        bridge is available, so concurrent tool calls overlap their database
+        round-trips on one long-lived async pool instead of each blocking a
+        sync connection. Falls back to the blocking path otherwise.
+
+        Args:
+            query: SQL query to execute
+            params: Optional dict of bind parameters
+
+        Returns:
+            dict with 'success', 'data' or 'error' keys
+        """
+        if run_async is not None:
+            try:
+                return run_async(self.aexecute_query(query, params))
+            except RuntimeError:
+                logger.debug("Background loop unavailable, using blocking query path")
+        return self._execute_query_blocking(query, params)
+
+    def _execute_query_blocking(self, query: str, params: dict = None) -> dict:
+        """
+        Execute a SQL query on a blocking connection from the sync pool.
+
         Args:
             query: SQL query to execute
             params: Optional dict of bind parameters
@@ -103,45 +198,109 @@ class OracleDirectTool:
                     # Fallback to direct connection
                     conn_params = _get_connection_params()
                     conn = oracledb.connect(**conn_params)
+            except Exception as e:
+                span.set_attribute("error", True)
+                return {"success": False, "error": str(e)}
 
+            # Release the connection on every path - a slot leaked on error
+            # is gone from the pool until process restart
+            try:
                 cursor = conn.cursor()
+                # Fetch in large batches to cut network round-trips
+                cursor.arraysize = 500
+                cursor.prefetchrows = 501
                 cursor.execute(query, params or {})
 
-                # Get column names
-                columns = [col[0].lower() for col in cursor.description] if cursor.description else []
-
-                # Fetch results
-                rows = cursor.fetchall()
-
-                # Convert to list of dicts
-                data = []
-                for row in rows:
-                    row_dict = {}
-                    for i, col in enumerate(columns):
-                        value = row[i]
-                        # Handle CLOB/LOB types
-                        if hasattr(value, 'read'):
-                            value = value.read()
-                        row_dict[col] = value
-                    data.append(row_dict)
+                if cursor.description:
+                    # fetch_lobs=False delivers CLOB/BLOB cells as str/bytes,
+                    # so the rowfactory is a plain C-level dict(zip(...))
+                    columns = tuple(col[0].lower() for col in cursor.description)
+                    cursor.rowfactory = lambda *row, _columns=columns: dict(zip(_columns, row))
+                    data = cursor.fetchall()
+                else:
+                    data = []
 
                 span.set_attribute("db.rows_affected", len(data))
 
                 cursor.close()
+                return {"success": True, "data": data}
+
+            except oracledb.Error as e:
+                span.set_attribute("error", True)
+                error_msg = str(e)
+                return {"success": False, "error": error_msg}
+            except Exception as e:
+                span.set_attribute("error", True)
+                return {"success": False, "error": str(e)}
+            finally:
                 if pool:
                     pool.release(conn)
                 else:
                     conn.close()
 
+    async def aexecute_query(self, query: str, params: dict = None) -> dict:
+        """
+        Execute a SQL query using oracledb's thin async API.
+
+        This is the path execute_query submits to the shared background
+        loop; concurrent callers overlap their network round-trips on one
+        async pool instead of serializing behind blocking connections.
+
+        Args:
+            query: SQL query to execute
+            params: Optional dict of bind parameters
+
+        Returns:
+            dict with 'success', 'data' or 'error' keys
+        """
+        with tracer.start_as_current_span("oracle_query") as span:
+            span.set_attribute("db.system", "oracle")
+            span.set_attribute("db.statement", query[:500])
+
+            pool = _get_async_connection_pool()
+
+            try:
+                if pool:
+                    conn = await pool.acquire()
+                else:
+                    # Fallback to direct async connection
+                    conn_params = _get_connection_params()
+                    conn = await oracledb.connect_async(**conn_params)
+            except Exception as e:
+                span.set_attribute("error", True)
+                return {"success": False, "error": str(e)}
+
+            # Release the connection on every path - a slot leaked on error
+            # is gone from the pool until process restart
+            try:
+                cursor = conn.cursor()
+                cursor.arraysize = 500
+                cursor.prefetchrows = 501
+                await cursor.execute(query, params or {})
+
+                if cursor.description:
+                    columns = tuple(col[0].lower() for col in cursor.description)
+                    cursor.rowfactory = lambda *row, _columns=columns: dict(zip(_columns, row))
+                    data = await cursor.fetchall()
+                else:
+                    data = []
+
+                span.set_attribute("db.rows_affected", len(data))
+
+                cursor.close()
                 return {"success": True, "data": data}
 
             except oracledb.Error as e:
                 span.set_attribute("error", True)
-                error_msg = str(e)
-                return {"success": False, "error": error_msg}
+                return {"success": False, "error": str(e)}
             except Exception as e:
                 span.set_attribute("error", True)
                 return {"success": False, "error": str(e)}
+            finally:
+                if pool:
+                    await pool.release(conn)
+                else:
+                    await conn.close()
 
 
 class OracleMCPTool:
@@ -157,35 +316,35 @@ class OracleMCPTool:
     - Observable trace spans for MCP operations
     """
 
+    # Cached server health shared across tool instances, so a slow/down MCP
+    # server costs one 2s probe per TTL window instead of one per instance
+    _HEALTH_TTL = 30.0
+    _health = {"ok": False, "expires": 0.0}
+
     def __init__(self):
         """Initialize the MCP tool with client."""
         self._client = get_mcp_client() if get_mcp_client else None
-        self._server_verified = False
 
     @property
     def is_available(self) -> bool:
-        """Check if MCP client is available and server is reachable."""
+        """Check if MCP client is available and server is reachable (cached)."""
         if self._client is None or not MCP_AVAILABLE:
             return False
 
-        # Only verify server connectivity once
-        if not self._server_verified:
-            try:
-                import urllib.request
-                import urllib.error
-                # Quick check if MCP server is responding
-                req = urllib.request.Request(
-                    f"http://{self._client.host}:{self._client.port}",
-                    method='HEAD'
-                )
-                req.add_header('User-Agent', 'code-assistant')
-                urllib.request.urlopen(req, timeout=2)
-                self._server_verified = True
-            except (urllib.error.URLError, TimeoutError, OSError):
-                # Server not reachable
-                return False
-
-        return self._server_verified
+        health = OracleMCPTool._health
+        if time.monotonic() < health["expires"]:
+            return health["ok"]
+
+        # Probe by listing tools - this exercises the real MCP handshake,
+        # unlike an HTTP HEAD the server is not guaranteed to honor
+        try:
+            tools = run_async(asyncio.wait_for(self._client.list_tools(), timeout=2))
+            health["ok"] = bool(tools)
+        except Exception:
+            health["ok"] = False
+        health["expires"] = time.monotonic() + self._HEALTH_TTL
+
+        return health["ok"]
 
     def execute_query(self, query: str, params: dict = None) -> dict:
         """
@@ -254,18 +413,35 @@ def _get_tool_instance():
     return OracleDirectTool()
 
 
-# Choose tool implementation based on configuration
-# Uses MCP when enabled and available, falls back to direct oracledb
-_oracle_tool = _get_tool_instance()
+# Tool implementation chosen lazily on first use, so importing this module
+# (e.g. at Streamlit startup) doesn't probe the MCP server or touch Oracle
+_oracle_tool = None
+_oracle_tool_lock = threading.Lock()
+
+
+def _get_oracle_tool():
+    """Get the shared tool instance, selecting MCP vs direct on first call."""
+    global _oracle_tool
+    tool_instance = _oracle_tool
+    if tool_instance is not None:
+        return tool_instance
+    with _oracle_tool_lock:
+        if _oracle_tool is None:
+            _oracle_tool = _get_tool_instance()
+        return _oracle_tool
+
+
+# Statement separators / comment markers stripped from filter values
+_STRIP_RE = re.compile(r"(--|;)")
 
 
 def _sanitize_input(value: str, max_length: int = 100) -> str:
     """Sanitize input to prevent SQL injection."""
     if not value:
         return ""
-    # Remove dangerous characters and limit length
-    sanitized = value.replace("'", "''").replace(";", "").replace("--", "")
-    return sanitized[:max_length]
+    # Values are passed as bind parameters (and quote-escaped on the MCP
+    # path by _substitute_params), so only strip statement separators
+    return _STRIP_RE.sub("", value)[:max_length]
 
 
 def _validate_limit(limit: int) -> int:
@@ -275,6 +451,72 @@ def _validate_limit(limit: int) -> int:
     return min(limit, 20)  # Max 20 results
 
 
+# WHERE conditions per filter, in a fixed order so each filter combination
+# maps to one SQL text
+_FILTER_CONDITIONS = (
+    ("language", "LOWER(language) = LOWER(:language)"),
+    ("category", "LOWER(category) = LOWER(:category)"),
+    ("framework", "LOWER(framework) LIKE LOWER(:framework)"),
+    ("keyword", """(
+            LOWER(title) LIKE LOWER(:keyword)
+            OR LOWER(description) LIKE LOWER(:keyword)
+            OR LOWER(tags) LIKE LOWER(:keyword)
+        )""")
+)
+
+# SQL text per filter combination, built lazily. Reusing identical text
+# (with the limit as a bind variable) lets the oracledb statement cache and
+# the server's plan cache kick in instead of hard-parsing per call.
+_search_query_cache: Dict[tuple, str] = {}
+
+
+def _get_search_query(filter_key: tuple) -> str:
+    """Get (or build) the search SQL for a (language, category, framework, keyword) presence key."""
+    query = _search_query_cache.get(filter_key)
+    if query is None:
+        conditions = [
+            condition
+            for (_, condition), present in zip(_FILTER_CONDITIONS, filter_key)
+            if present
+        ]
+        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        query = _search_query_cache[filter_key] = f"""
+        SELECT id, title, description, language, framework, category, difficulty, code, tags
+        FROM code_snippets
+        WHERE {where_clause}
+        ORDER BY created_at DESC
+        FETCH FIRST :lim ROWS ONLY
+    """
+    return query
+
+
+def _prepare_params(language, category, framework, keyword, limit) -> tuple:
+    """
+    Sanitize the search filters and clamp the limit in a single pass.
+
+    Returns:
+        (bind params dict including 'lim', filter presence key)
+    """
+    params = {"lim": 5 if not isinstance(limit, int) or limit < 1 else min(limit, 20)}
+    filter_key = []
+
+    for name, value in (
+        ("language", language),
+        ("category", category),
+        ("framework", framework),
+        ("keyword", keyword)
+    ):
+        safe_value = _STRIP_RE.sub("", value)[:100] if value else ""
+        if safe_value:
+            # framework/keyword filters match with LIKE, so wrap in wildcards
+            if name in ("framework", "keyword"):
+                safe_value = f"%{safe_value}%"
+            params[name] = safe_value
+        filter_key.append(bool(safe_value))
+
+    return params, tuple(filter_key)
+
+
 @tool
 def search_code_snippets(
     language: Optional[str] = None,
@@ -296,51 +538,101 @@ def search_code_snippets(
     Returns:
         JSON string of matching code snippets
     """
-    # Sanitize all inputs to prevent SQL injection
-    safe_language = _sanitize_input(language) if language else None
-    safe_category = _sanitize_input(category) if category else None
-    safe_framework = _sanitize_input(framework) if framework else None
-    safe_keyword = _sanitize_input(keyword) if keyword else None
-    safe_limit = _validate_limit(limit)
-
-    # Build WHERE clause with sanitized inputs
-    conditions = []
-    params = {}
-
-    if safe_language:
-        conditions.append("LOWER(language) = LOWER(:language)")
-        params["language"] = safe_language
-    if safe_category:
-        conditions.append("LOWER(category) = LOWER(:category)")
-        params["category"] = safe_category
-    if safe_framework:
-        conditions.append("LOWER(framework) LIKE LOWER(:framework)")
-        params["framework"] = f"%{safe_framework}%"
-    if safe_keyword:
-        conditions.append("""(
-            LOWER(title) LIKE LOWER(:keyword)
-            OR LOWER(description) LIKE LOWER(:keyword)
-            OR LOWER(tags) LIKE LOWER(:keyword)
-        )""")
-        params["keyword"] = f"%{safe_keyword}%"
+    params, filter_key = _prepare_params(language, category, framework, keyword, limit)
+    query = _get_search_query(filter_key)
 
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
+    result = _get_oracle_tool().execute_query(query, params)
 
-    query = f"""
-        SELECT id, title, description, language, framework, category, difficulty, code, tags
-        FROM code_snippets
-        WHERE {where_clause}
-        ORDER BY created_at DESC
-        FETCH FIRST {safe_limit} ROWS ONLY
+    if result["success"]:
+        return _dumps(result["data"])
+    else:
+        return f"Error searching snippets: {result['error']}"
+
+
+@tool
+def search_code_snippets_batch(filters: List[Dict[str, Any]]) -> str:
     """
+    Run several code snippet searches in a single database round-trip.
 
-    result = _oracle_tool.execute_query(query, params)
+    Use this instead of calling search_code_snippets repeatedly, e.g. when
+    comparing snippets across multiple languages or frameworks.
 
-    if result["success"]:
-        return json.dumps(result["data"], indent=2, default=str)
-    else:
+    Args:
+        filters: List of filter dicts, each with any of the keys
+            'language', 'category', 'framework', 'keyword', 'limit'
+            (same meaning as the search_code_snippets arguments)
+
+    Returns:
+        JSON string: a list with one result list per input filter, in order
+    """
+    if not filters:
+        return "Error: filters must be a non-empty list"
+
+    selects = []
+    params: Dict[str, Any] = {}
+
+    for idx, filters_dict in enumerate(filters):
+        if not isinstance(filters_dict, dict):
+            return f"Error: filter {idx} must be a dict"
+
+        prefix = f"p{idx}_"
+        conditions = []
+
+        for name, condition in _FILTER_CONDITIONS:
+            value = filters_dict.get(name)
+            if not value:
+                continue
+            safe_value = _sanitize_input(str(value))
+            if not safe_value:
+                continue
+            conditions.append(condition.replace(f":{name}", f":{prefix}{name}"))
+            if name in ("framework", "keyword"):
+                safe_value = f"%{safe_value}%"
+            params[f"{prefix}{name}"] = safe_value
+
+        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        params[f"{prefix}lim"] = _validate_limit(filters_dict.get("limit", 5))
+
+        # Inner query applies ORDER BY / FETCH FIRST per filter; the outer
+        # SELECT tags rows with the filter index for client-side grouping
+        selects.append(f"""
+        SELECT {idx} AS fidx, id, title, description, language, framework, category, difficulty, code, tags
+        FROM (
+            SELECT id, title, description, language, framework, category, difficulty, code, tags
+            FROM code_snippets
+            WHERE {where_clause}
+            ORDER BY created_at DESC
+            FETCH FIRST :{prefix}lim ROWS ONLY
+        )""")
+
+    query = "\n        UNION ALL".join(selects)
+
+    result = _get_oracle_tool().execute_query(query, params)
+
+    if not result["success"]:
         return f"Error searching snippets: {result['error']}"
 
+    # Row shape depends on the backend: the direct tool yields dicts with
+    # lowercase keys, while the SQLcl MCP server emits whatever its JSON
+    # (typically uppercase columns) or plain text output contains
+    data = result["data"]
+    if not isinstance(data, list):
+        return f"Error searching snippets: unexpected result format: {str(data)[:200]}"
+
+    grouped: List[List[dict]] = [[] for _ in filters]
+    for row in data:
+        if not isinstance(row, dict):
+            return f"Error searching snippets: unexpected row format: {str(row)[:200]}"
+        fidx_key = next((key for key in row if key.lower() == "fidx"), None)
+        if fidx_key is None:
+            return "Error searching snippets: result rows are missing the fidx filter tag"
+        try:
+            grouped[int(row.pop(fidx_key))].append(row)
+        except (ValueError, TypeError, IndexError):
+            return "Error searching snippets: result rows carry an invalid fidx filter tag"
+
+    return _dumps(grouped)
+
 
 @tool
 def get_snippet_by_id(snippet_id: int) -> str:
@@ -363,16 +655,45 @@ def get_snippet_by_id(snippet_id: int) -> str:
         WHERE id = :id
     """
 
-    result = _oracle_tool.execute_query(query, {"id": int(snippet_id)})
+    result = _get_oracle_tool().execute_query(query, {"id": int(snippet_id)})
 
     if result["success"]:
         if result["data"]:
-            return json.dumps(result["data"][0], indent=2, default=str)
+            return _dumps(result["data"][0])
         return "Snippet not found"
     else:
         return f"Error fetching snippet: {result['error']}"
 
 
+# The category/language aggregates change on the order of minutes-to-hours,
+# so repeated agent calls hit this cache instead of re-running the GROUP BY
+_meta_cache = TTLCache(maxsize=4, ttl=300)
+
+
+@cached(_meta_cache)
+def _fetch_grouped_counts(column: str) -> str:
+    """Fetch '<column>, count' aggregates as a JSON string (cached with TTL)."""
+    query = f"""
+        SELECT {column}, COUNT(*) as count
+        FROM code_snippets
+        GROUP BY {column}
+        ORDER BY count DESC
+    """
+
+    result = _get_oracle_tool().execute_query(query)
+
+    if not result["success"]:
+        # Raise so failures are not cached for the full TTL
+        raise RuntimeError(result["error"])
+
+    return _dumps(result["data"])
+
+
+def clear_metadata_cache():
+    """Invalidate the cached category/language aggregates."""
+    _meta_cache.clear()
+
+
 @tool
 def list_available_categories() -> str:
     """
@@ -381,19 +702,10 @@ def list_available_categories() -> str:
     Returns:
         JSON string of categories with counts
     """
-    query = """
-        SELECT category, COUNT(*) as count
-        FROM code_snippets
-        GROUP BY category
-        ORDER BY count DESC
-    """
-
-    result = _oracle_tool.execute_query(query)
-
-    if result["success"]:
-        return json.dumps(result["data"], indent=2)
-    else:
-        return f"Error listing categories: {result['error']}"
+    try:
+        return _fetch_grouped_counts("category")
+    except RuntimeError as e:
+        return f"Error listing categories: {e}"
 
 
 @tool
@@ -404,24 +716,16 @@ def list_available_languages() -> str:
     Returns:
         JSON string of languages with counts
     """
-    query = """
-        SELECT language, COUNT(*) as count
-        FROM code_snippets
-        GROUP BY language
-        ORDER BY count DESC
-    """
-
-    result = _oracle_tool.execute_query(query)
-
-    if result["success"]:
-        return json.dumps(result["data"], indent=2)
-    else:
-        return f"Error listing languages: {result['error']}"
+    try:
+        return _fetch_grouped_counts("language")
+    except RuntimeError as e:
+        return f"Error listing languages: {e}"
 
 
 # Export tools for use in agents
 __all__ = [
     "search_code_snippets",
+    "search_code_snippets_batch",
     "get_snippet_by_id",
     "list_available_categories",
     "list_available_languages"
@@ -14,6 +14,8 @@ SQLcl MCP Server Tools:
 import asyncio
 import json
 import os
+import re
+import threading
 from typing import Optional, Dict, Any, List
 from contextlib import asynccontextmanager
 
@@ -22,13 +24,14 @@ try:
     from src.telemetry import get_tracer
     tracer = get_tracer(__name__)
 except ImportError:
-    from contextlib import contextmanager
+    # Shared sentinel span in a nullcontext avoids per-call generator and
+    # span-instance allocation when telemetry is unavailable
+    from contextlib import nullcontext
+    _NOOP_SPAN = type("NoOpSpan", (), {"set_attribute": lambda *args: None})()
+
     class NoOpTracer:
-        @contextmanager
         def start_as_current_span(self, name, **kwargs):
-            class NoOpSpan:
-                def set_attribute(self, k, v): pass
-            yield NoOpSpan()
+            return nullcontext(_NOOP_SPAN)
     tracer = NoOpTracer()
 
 # Try to import MCP SDK
@@ -41,6 +44,19 @@ except ImportError:
     print("Warning: MCP SDK not available. Install with: pip install mcp")
 
 
+# Matches :name bind placeholders
+_PARAM_RE = re.compile(r":([A-Za-z_]\w*)")
+
+
+def _sql_literal(value) -> str:
+    """Render a Python value as a SQL literal (MCP has no bind support)."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    return str(value)
+
+
 class SQLclMCPClient:
     """
     Client for connecting to SQLcl MCP Server via SSE transport.
@@ -62,6 +78,12 @@ class SQLclMCPClient:
         self.base_url = f"http://{host}:{port}"
         self._connected = False
 
+        # Long-lived session state (created lazily by _ensure_session)
+        self._session: Optional["ClientSession"] = None
+        self._sse_cm = None
+        self._session_cm = None
+        self._session_lock = asyncio.Lock()
+
     @property
     def is_available(self) -> bool:
         """Check if MCP SDK is available."""
@@ -83,6 +105,77 @@ class SQLclMCPClient:
                 await session.initialize()
                 yield session
 
+    async def _ensure_session(self) -> "ClientSession":
+        """
+        Get the long-lived MCP session, creating it on first use.
+
+        One SSE transport + session is kept open and the database `connect`
+        tool is called once per session, so execute_sql pays a single
+        round-trip per query instead of initialize + connect + run-sql.
+
+        Returns:
+            Initialized and connected ClientSession
+        """
+        if self._session is not None:
+            return self._session
+
+        async with self._session_lock:
+            if self._session is not None:
+                return self._session
+
+            if not MCP_AVAILABLE:
+                raise RuntimeError("MCP SDK not installed")
+
+            try:
+                self._sse_cm = sse_client(self.base_url)
+                read, write = await self._sse_cm.__aenter__()
+                self._session_cm = ClientSession(read, write)
+                session = await self._session_cm.__aenter__()
+                await session.initialize()
+
+                # Connect to the database once for the session's lifetime
+                with tracer.start_as_current_span("sqlcl_mcp.connect") as span:
+                    span.set_attribute("mcp.tool", "connect")
+                    connect_args = {
+                        "username": os.getenv("ORACLE_USER", "codeassist"),
+                        "password": os.getenv("ORACLE_PASSWORD", "CodeAssist123"),
+                        "connect_string": (
+                            f"{os.getenv('ORACLE_HOST', 'oracle-db')}:"
+                            f"{os.getenv('ORACLE_PORT', '1521')}/"
+                            f"{os.getenv('ORACLE_SERVICE', 'FREEPDB1')}"
+                        )
+                    }
+                    await session.call_tool("connect", connect_args)
+            except Exception:
+                await self._teardown_session()
+                raise
+
+            self._session = session
+            self._connected = True
+            return session
+
+    async def _teardown_session(self):
+        """Close the session and SSE transport, ignoring teardown errors."""
+        self._session = None
+        self._connected = False
+        if self._session_cm is not None:
+            try:
+                await self._session_cm.__aexit__(None, None, None)
+            except Exception:
+                pass
+            self._session_cm = None
+        if self._sse_cm is not None:
+            try:
+                await self._sse_cm.__aexit__(None, None, None)
+            except Exception:
+                pass
+            self._sse_cm = None
+
+    async def aclose(self):
+        """Tear down the long-lived MCP session."""
+        async with self._session_lock:
+            await self._teardown_session()
+
     async def list_tools(self) -> List[str]:
         """
         List available tools from SQLcl MCP server.
@@ -145,10 +238,9 @@ class SQLclMCPClient:
         """
         Execute SQL via SQLcl MCP Server.
 
-        This method:
-        1. Connects to the database (if not connected)
-        2. Executes the SQL query using run-sql tool
-        3. Returns results
+        Uses the long-lived session from _ensure_session, so steady-state
+        queries cost a single run-sql round-trip; the initialize + connect
+        handshake only happens when the session is (re)created.
 
         Args:
             query: SQL query to execute
@@ -167,36 +259,28 @@ class SQLclMCPClient:
                 # MCP doesn't support bind parameters directly
                 final_query = self._substitute_params(query, params)
 
-                async with self.get_session() as session:
-                    # Step 1: Connect to database
-                    with tracer.start_as_current_span("sqlcl_mcp.connect") as conn_span:
-                        conn_span.set_attribute("mcp.tool", "connect")
-                        connect_args = {
-                            "username": os.getenv("ORACLE_USER", "codeassist"),
-                            "password": os.getenv("ORACLE_PASSWORD", "CodeAssist123"),
-                            "connect_string": (
-                                f"{os.getenv('ORACLE_HOST', 'oracle-db')}:"
-                                f"{os.getenv('ORACLE_PORT', '1521')}/"
-                                f"{os.getenv('ORACLE_SERVICE', 'FREEPDB1')}"
-                            )
-                        }
-                        await session.call_tool("connect", connect_args)
-
-                    # Step 2: Execute SQL
-                    with tracer.start_as_current_span("sqlcl_mcp.run-sql") as sql_span:
-                        sql_span.set_attribute("mcp.tool", "run-sql")
-                        sql_span.set_attribute("db.statement", final_query[:500])
+                session = await self._ensure_session()
+
+                with tracer.start_as_current_span("sqlcl_mcp.run-sql") as sql_span:
+                    sql_span.set_attribute("mcp.tool", "run-sql")
+                    sql_span.set_attribute("db.statement", final_query[:500])
 
+                    try:
+                        result = await session.call_tool("run-sql", {"sql": final_query})
+                    except Exception:
+                        # Session may be stale (server restart) - rebuild once
+                        await self.aclose()
+                        session = await self._ensure_session()
                         result = await session.call_tool("run-sql", {"sql": final_query})
 
-                        # Parse result
-                        data = self._parse_result(result)
+                    # Parse result
+                    data = self._parse_result(result)
 
-                        if isinstance(data, list):
-                            span.set_attribute("db.rows_affected", len(data))
-                            sql_span.set_attribute("db.rows_affected", len(data))
+                    if isinstance(data, list):
+                        span.set_attribute("db.rows_affected", len(data))
+                        sql_span.set_attribute("db.rows_affected", len(data))
 
-                        return {"success": True, "data": data}
+                    return {"success": True, "data": data}
 
             except Exception as e:
                 span.set_attribute("error", True)
@@ -217,18 +301,10 @@ class SQLclMCPClient:
         if not params:
             return query
 
-        result = query
-        for key, value in params.items():
-            placeholder = f":{key}"
-            if isinstance(value, str):
-                # Escape single quotes for SQL strings
-                safe_value = value.replace("'", "''")
-                result = result.replace(placeholder, f"'{safe_value}'")
-            elif value is None:
-                result = result.replace(placeholder, "NULL")
-            else:
-                result = result.replace(placeholder, str(value))
-        return result
+        # Single pass over the query; the \w+ match also stops :keyword from
+        # clobbering a longer placeholder like :keyword2
+        lookup = {key: _sql_literal(value) for key, value in params.items()}
+        return _PARAM_RE.sub(lambda m: lookup.get(m.group(1), m.group(0)), query)
 
     def _parse_result(self, result) -> Any:
         """
@@ -262,8 +338,11 @@ class SQLclMCPClient:
         return result
 
 
-# Singleton instance
+# Singleton instance, double-checked init. The common no-override call
+# returns the existing client with a single `is not None` check instead of
+# re-resolving settings and comparing host/port every time.
 _mcp_client: Optional[SQLclMCPClient] = None
+_mcp_client_lock = threading.Lock()
 
 
 def get_mcp_client(host: str = None, port: int = None) -> SQLclMCPClient:
@@ -279,47 +358,70 @@ def get_mcp_client(host: str = None, port: int = None) -> SQLclMCPClient:
     """
     global _mcp_client
 
-    # Import settings
-    try:
-        from src.config import settings
-        default_host = settings.sqlcl_mcp_host
-        default_port = settings.sqlcl_mcp_port
-    except ImportError:
-        default_host = "localhost"
-        default_port = 8080
+    client = _mcp_client
+    if client is not None and host is None and port is None:
+        return client
+
+    with _mcp_client_lock:
+        try:
+            from src.config import settings
+            default_host = settings.sqlcl_mcp_host
+            default_port = settings.sqlcl_mcp_port
+        except ImportError:
+            default_host = "localhost"
+            default_port = 8080
+
+        actual_host = host or default_host
+        actual_port = port or default_port
+
+        if _mcp_client is None or _mcp_client.host != actual_host or _mcp_client.port != actual_port:
+            _mcp_client = SQLclMCPClient(host=actual_host, port=actual_port)
+
+        return _mcp_client
 
-    actual_host = host or default_host
-    actual_port = port or default_port
 
-    if _mcp_client is None or _mcp_client.host != actual_host or _mcp_client.port != actual_port:
-        _mcp_client = SQLclMCPClient(host=actual_host, port=actual_port)
+# Dedicated background event loop shared by all sync callers. Loop-bound
+# resources (the persistent MCP session, async connection pools) live on
+# this loop and survive across calls.
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
 
-    return _mcp_client
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared background event loop, starting its thread on first use."""
+    global _background_loop
+
+    loop = _background_loop
+    if loop is not None:
+        return loop
+
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="mcp-event-loop",
+                daemon=True
+            ).start()
+            _background_loop = loop
+        return _background_loop
 
 
 def run_async(coro):
     """
     Helper to run async code in sync context.
 
+    Submits the coroutine to the shared background event loop instead of
+    running asyncio.run per call, which would tear down every loop-bound
+    resource (SSE transport, MCP session) each time.
+
     Args:
         coro: Coroutine to run
 
     Returns:
         Result of the coroutine
     """
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # If loop is running (e.g., in Jupyter), use nest_asyncio or create task
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, coro)
-                return future.result()
-        else:
-            return loop.run_until_complete(coro)
-    except RuntimeError:
-        # No event loop, create one
-        return asyncio.run(coro)
+    return asyncio.run_coroutine_threadsafe(coro, _get_background_loop()).result()
 
 
 __all__ = [
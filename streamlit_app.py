@@ -11,13 +11,19 @@ warnings.filterwarnings("ignore", message=".*Pydantic V1.*Python 3.14.*")
 warnings.filterwarnings("ignore", category=UserWarning, module="langchain_core")
 
 # Configure logging to suppress debug messages in production
-import logging
-logging.getLogger("src").setLevel(logging.WARNING)
-logging.getLogger("opentelemetry").setLevel(logging.WARNING)
-logging.getLogger("urllib3").setLevel(logging.WARNING)
-logging.getLogger("httpx").setLevel(logging.WARNING)
-
-from src.frontend.app import main
+# (one atomic dictConfig call instead of four setLevel lock acquisitions)
+import logging.config
+logging.config.dictConfig({
+    "version": 1,
+    "disable_existing_loggers": False,
+    "loggers": {
+        name: {"level": "WARNING"}
+        for name in ("src", "opentelemetry", "urllib3", "httpx")
+    }
+})
 
 if __name__ == "__main__":
+    # Deferred so the heavy agent/tool imports only run when the app starts,
+    # not when this module is merely imported
+    from src.frontend.app import main
     main()